@@ -1,6 +1,26 @@
 const { InstanceBase, InstanceStatus, runEntrypoint, combineRgb } = require('@companion-module/base')
 const WebSocket = require('ws')
 
+// Requests without parameters are serialized once instead of on every send
+const GET_DISCUSSION_LIST_REQUEST = JSON.stringify({ operation: 'GetDiscussionList', parameters: {} })
+const GET_INTERPRETATION_ROUTINGS_REQUEST = JSON.stringify({ operation: 'GetInterpretationRoutings', parameters: {} })
+const GET_PERMISSIONS_REQUEST = JSON.stringify({ operation: 'GetPermissions', parameters: {} })
+const GET_SEATS_REQUEST = JSON.stringify({ operation: 'getseats', parameters: {} })
+const GET_INTERPRETER_BOOTHS_REQUEST = JSON.stringify({ operation: 'GetInterpreterBooths', parameters: {} })
+const GET_INTERPRETER_SEATS_REQUEST = JSON.stringify({ operation: 'GetInterpreterSeats', parameters: {} })
+
+// Responses to polled requests arrive every poll tick and are not logged
+const POLLED_OPERATIONS = new Set(['GetDiscussionList', 'GetInterpretationRoutings'])
+
+// How long an unanswered poll may hold back the next one (ms)
+const POLL_RESPONSE_TIMEOUT = 1000
+
+// First run of digits in a seat name, used to order seats numerically
+const SEAT_NUMBER_REGEX = /\d+/
+
+// Window for coalescing definition rebuilds triggered by seat list responses
+const DEFINITIONS_UPDATE_DELAY = 100
+
 class BoschDicentisInstance extends InstanceBase {
 	constructor(internal) {
 		super(internal)
@@ -11,19 +31,30 @@ class BoschDicentisInstance extends InstanceBase {
 		this.isInitialized = false
 		this.isLoggedIn = false
 		this.seats = {}
+		this.seatsById = new Map()
+		this.seatChoices = null
 		this.interpreterSeats = {}
+		this.interpreterSeatChoices = null
 		this.interpreterBooths = new Map()
+		this.interpreterBoothsLoaded = false
+		this.pendingInterpreterSeats = null
 		this.activeMics = new Set()
 		this.activeInterpreterStates = new Map()
 		this.ws = null
 		this.reconnectTimer = null
 		this.pollTimer = null
+		this.definitionsTimer = null
+		this.pendingPolls = new Map()
+		this.lastDiscussionListData = null
+		this.lastInterpretationRoutingsData = null
 
 		this.lastServerIp = null
 		this.lastUsername = null
 		this.lastPassword = null
 
 		this.discussionList = []
+		this.activeScreenLine = ''
+		this.activeSeatName = ''
 		this.isConnecting = false
 	}
 
@@ -32,17 +63,25 @@ class BoschDicentisInstance extends InstanceBase {
 		return name.replace(/\s+/g, '_').replace(/[^a-zA-Z0-9_]/g, '_')
 	}
 
-	init(config) {
-		// Validate config
+	validateConfig(config) {
 		if (!config.server_ip) {
 			this.log('error', '[CONFIG] Server IP is required')
 			this.updateStatus(InstanceStatus.BadConfig, 'Server IP is required')
-			return
+			return false
 		}
-		
+
 		if (!config.username) {
 			this.log('error', '[CONFIG] Username is required')
 			this.updateStatus(InstanceStatus.BadConfig, 'Username is required')
+			return false
+		}
+
+		return true
+	}
+
+	init(config) {
+		// Validate config
+		if (!this.validateConfig(config)) {
 			return
 		}
 		
@@ -87,188 +126,10 @@ class BoschDicentisInstance extends InstanceBase {
 		this.setPresetDefinitions([])
 	}
 
-	initFeedbacks() {
-		this.setFeedbackDefinitions({
-			mic_state: {
-				type: 'boolean',
-				name: 'Microphone State',
-				description: 'Change button color based on microphone state',
-				defaultStyle: {
-					bgcolor: combineRgb(255, 0, 0),
-				},
-				options: [
-					{
-						type: 'dropdown',
-						label: 'Seat',
-						id: 'seat',
-						default: '',
-						choices: this.getSeatChoices(),
-					},
-				],
-				callback: (feedback) => {
-					const seatId = this.seats[feedback.options.seat]?.seatId
-					if (!seatId) {
-						return false
-					}
-
-					const state = this.isMicrophoneActive(seatId)
-					return state
-				},
-				subscribe: (feedback) => {
-				},
-				unsubscribe: (feedback) => {
-				},
-			},
-			interpreter_state: {
-				type: 'boolean',
-				name: 'Interpreter State',
-				description: 'Change button color based on interpreter state',
-				defaultStyle: {
-					bgcolor: combineRgb(255, 0, 0),
-				},
-				options: [
-					{
-						type: 'dropdown',
-						label: 'Interpreter Seat',
-						id: 'interpreter_seat',
-						default: '',
-						choices: this.getInterpreterSeatChoices(),
-					},
-				],
-				callback: (feedback) => {
-					const seatId = this.interpreterSeats[feedback.options.interpreter_seat]?.seatId
-					if (!seatId) {
-						return false
-					}
-
-					const state = this.isInterpreterActive(seatId)
-					return state
-				},
-				subscribe: (feedback) => {
-				},
-				unsubscribe: (feedback) => {
-				},
-			},
-		})
-	}
-
-	initActions() {
-		const choices = this.getSeatChoices()
-		const interpreterChoices = this.getInterpreterSeatChoices()
-
-		this.setActionDefinitions({
-			custom_command: {
-				name: 'Custom Command',
-				options: [
-					{
-						type: 'textinput',
-						label: 'Operation',
-						id: 'operation',
-						default: '',
-					},
-					{
-						type: 'textinput',
-						label: 'Parameters (JSON)',
-						id: 'parameters',
-						default: '{}',
-					},
-				],
-				callback: async (action) => {
-					try {
-						const parameters = JSON.parse(action.options.parameters)
-						const message = {
-							operation: action.options.operation,
-							parameters: parameters
-						}
-						if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-							this.ws.send(JSON.stringify(message))
-						} else {
-							this.log('error', '[CUSTOM] WebSocket not connected')
-						}
-					} catch (error) {
-						this.log('error', `[CUSTOM] Error parsing parameters JSON: ${error.message}`)
-					}
-				},
-			},
-			toggle_microphone: {
-				name: 'Toggle Microphone',
-				options: [
-					{
-						type: 'dropdown',
-						label: 'Seat',
-						id: 'seat',
-						default: choices[0]?.id || '',
-						choices: choices,
-					},
-				],
-				callback: async (action) => {
-					this.toggleMicrophone(action.options.seat)
-				},
-			},
-			activate_microphone: {
-				name: 'Activate Microphone',
-				options: [
-					{
-						type: 'dropdown',
-						label: 'Seat',
-						id: 'seat',
-						default: choices[0]?.id || '',
-						choices,
-					},
-				],
-				callback: async (action) => {
-					this.activateMicrophone(this.seats[action.options.seat]?.seatId)
-				},
-			},
-			deactivate_microphone: {
-				name: 'Deactivate Microphone',
-				options: [
-					{
-						type: 'dropdown',
-						label: 'Seat',
-						id: 'seat',
-						default: choices[0]?.id || '',
-						choices,
-					},
-				],
-				callback: async (action) => {
-					this.deactivateMicrophone(this.seats[action.options.seat]?.seatId)
-				},
-			},
-			grant_interpretation: {
-				name: 'Grant Interpretation',
-				options: [
-					{
-						type: 'dropdown',
-						label: 'Interpreter Seat',
-						id: 'interpreter_seat',
-						default: interpreterChoices[0]?.id || '',
-						choices: interpreterChoices,
-					},
-					{
-						type: 'dropdown',
-						label: 'State',
-						id: 'state',
-						default: 'off',
-						choices: [
-							{ id: 'off', label: 'Off' },
-							{ id: 'activeOnOutputA', label: 'Active on Output A' },
-							{ id: 'activeOnOutputB', label: 'Active on Output B' },
-							{ id: 'activeOnOutputC', label: 'Active on Output C' }
-						],
-					},
-				],
-				callback: async (action) => {
-					this.grantInterpretation(this.interpreterSeats[action.options.interpreter_seat]?.seatId, action.options.state)
-				},
-			},
-		})
-	}
-
 	updateVariables() {
 		const variables = {
-			Active_Microphone_ScreenLine: '',
-			Active_Microphone_SeatName: ''
+			Active_Microphone_ScreenLine: this.activeScreenLine,
+			Active_Microphone_SeatName: this.activeSeatName
 		}
 		const variableDefinitions = [
 			{ name: 'Active_Microphone_ScreenLine', variableId: 'Active_Microphone_ScreenLine' },
@@ -298,166 +159,90 @@ class BoschDicentisInstance extends InstanceBase {
 		this.setVariableValues(variables)
 	}
 
-	getSeatChoices() {
-		const choices = Object.entries(this.seats).map(([varName, seat]) => ({
-			id: varName,
-			label: varName
-		}))
-		return choices
-	}
+	// Seat and interpreter seat lists arrive in separate responses right after login,
+	// so rebuild variables, actions, feedbacks and presets once for both
+	scheduleDefinitionsUpdate() {
+		if (this.definitionsTimer) {
+			return
+		}
 
-	getInterpreterSeatChoices() {
-		const choices = Object.entries(this.interpreterSeats).map(([name, seat]) => ({
-			id: name,
-			label: name
-		}))
-		return choices
+		this.definitionsTimer = setTimeout(() => {
+			this.definitionsTimer = null
+			this.updateVariables()
+			this.updateActions()
+			this.updateFeedbacks()
+			this.updatePresets()
+
+			// Feedback results depend on the seat lists, while the state handlers
+			// only recheck them when mic or interpreter state changes
+			this.checkFeedbacks('mic_state', 'interpreter_state')
+		}, DEFINITIONS_UPDATE_DELAY)
 	}
 
-	initPresets() {
-		const presets = []
-
-		// Create array of seats first
-		const seatsArray = Array.from(Object.entries(this.seats))
-
-		// Create presets for each seat
-		seatsArray.forEach(([varName, seat]) => {
-			presets.push({
-				type: 'button',
-				category: 'Microphones',
-				name: seat.name + '\\n' + seat.screenLine,
-				style: {
-					text: seat.name + '\\n' + seat.screenLine,
-					size: 'auto',
-					color: combineRgb(255, 255, 255),
-					bgcolor: combineRgb(0, 0, 0),
-				},
-				steps: [
-					{
-						down: [
-							{
-								actionId: 'toggle_microphone',
-								options: {
-									seat: varName,
-								},
-							},
-						],
-					}
-				],
-				feedbacks: [
-					{
-						feedbackId: 'mic_state',
-						options: {
-							seat: varName,
-						},
-						style: {
-							bgcolor: combineRgb(255, 0, 0),
-						},
-					},
-				],
-			})
-		})
-
-		// Create presets for each interpreter seat
-		Object.entries(this.interpreterSeats).forEach(([name, seat]) => {
-			presets.push({
-				type: 'button',
-				category: 'Interpreters',
-				name: `Booth ${seat.boothNumber}\\nDesk ${seat.deskNumber}`,
-				style: {
-					text: `Booth ${seat.boothNumber}\\nDesk ${seat.deskNumber}`,
-					size: 'auto',
-					color: combineRgb(255, 255, 255),
-					bgcolor: combineRgb(0, 0, 0),
-				},
-				steps: [
-					{
-						down: [
-							{
-								actionId: 'grant_interpretation',
-								options: {
-									interpreter_seat: name,
-									state: 'activeOnOutputA',
-								},
-							},
-						],
-						up: [
-							{
-								actionId: 'grant_interpretation',
-								options: {
-									interpreter_seat: name,
-									state: 'off',
-								},
-							},
-						],
-					},
-				],
-				feedbacks: [
-					{
-						feedbackId: 'interpreter_state',
-						options: {
-							interpreter_seat: name,
-						},
-						style: {
-							bgcolor: combineRgb(255, 0, 0),
-						},
-					},
-				],
-			})
-		})
+	// Choices are built once per seat list and shared by actions and feedbacks
+	getSeatChoices() {
+		if (!this.seatChoices) {
+			this.seatChoices = Object.keys(this.seats).map(varName => ({
+				id: varName,
+				label: varName
+			}))
+		}
+		return this.seatChoices
+	}
 
-		this.setPresetDefinitions(presets)
+	getInterpreterSeatChoices() {
+		if (!this.interpreterSeatChoices) {
+			this.interpreterSeatChoices = Object.keys(this.interpreterSeats).map(name => ({
+				id: name,
+				label: name
+			}))
+		}
+		return this.interpreterSeatChoices
 	}
 
 	startPolling() {
 		// Clear any existing polling
 		this.stopPolling()
+		this.pendingPolls.clear()
+		this.lastDiscussionListData = null
+		this.lastInterpretationRoutingsData = null
 
 		const pollInterval = this.config.pollInterval || 100
 
 		// Send initial requests
-		this.sendDiscussionListRequest()
-		setTimeout(() => this.sendInterpretationRoutingsRequest(), 50)
-
-		// Set up continuous polling
-		const discussionListTimer = setInterval(() => this.sendDiscussionListRequest(), pollInterval)
-		const interpretationRoutingsTimer = setInterval(() => this.sendInterpretationRoutingsRequest(), pollInterval)
+		this.poll()
 
-		// Store timers for cleanup
-		this.pollTimer = {
-			discussionList: discussionListTimer,
-			interpretationRoutings: interpretationRoutingsTimer
-		}
+		// Set up continuous polling on a single timer
+		this.pollTimer = setInterval(() => this.poll(), pollInterval)
 	}
 
-	sendDiscussionListRequest() {
-		if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-			const message = {
-				operation: 'GetDiscussionList',
-				parameters: {}
-			}
-			this.ws.send(JSON.stringify(message))
+	poll() {
+		// Check the socket once per tick for both requests
+		const ws = this.ws
+		if (!ws || ws.readyState !== WebSocket.OPEN) {
+			return
 		}
+
+		const now = Date.now()
+		this.sendPollRequest(ws, 'GetDiscussionList', GET_DISCUSSION_LIST_REQUEST, now)
+		this.sendPollRequest(ws, 'GetInterpretationRoutings', GET_INTERPRETATION_ROUTINGS_REQUEST, now)
 	}
 
-	sendInterpretationRoutingsRequest() {
-		if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-			const message = {
-				operation: 'GetInterpretationRoutings',
-				parameters: {}
-			}
-			this.ws.send(JSON.stringify(message))
+	sendPollRequest(ws, operation, request, now) {
+		// Skip a request while its previous one is unanswered so a slow server doesn't
+		// build up a backlog, but resend if the answer never comes
+		const sentAt = this.pendingPolls.get(operation)
+		if (sentAt !== undefined && now - sentAt < POLL_RESPONSE_TIMEOUT) {
+			return
 		}
+
+		this.pendingPolls.set(operation, now)
+		ws.send(request)
 	}
 
 	stopPolling() {
 		if (this.pollTimer) {
-			if (this.pollTimer.discussionList) {
-				clearInterval(this.pollTimer.discussionList)
-			}
-			if (this.pollTimer.interpretationRoutings) {
-				clearInterval(this.pollTimer.interpretationRoutings)
-			}
+			clearInterval(this.pollTimer)
 			this.pollTimer = null
 		}
 	}
@@ -468,6 +253,12 @@ class BoschDicentisInstance extends InstanceBase {
 		}
 
 		this.isConnecting = true
+
+		// Remember what this connection was made with so configUpdated can tell if it changed
+		this.lastServerIp = this.config.server_ip
+		this.lastUsername = this.config.username
+		this.lastPassword = this.config.password
+
 		const wsUrl = `wss://${this.config.server_ip}:31416/Dicentis/API`
 
 		try {
@@ -479,7 +270,9 @@ class BoschDicentisInstance extends InstanceBase {
 			this.ws = new WebSocket(wsUrl, 'DICENTIS_1_0', {
 				rejectUnauthorized: false,
 				requestCert: false,
-				agent: false
+				agent: false,
+				// Small JSON messages on a LAN gain nothing from deflate but pay for it on every poll
+				perMessageDeflate: false
 			})
 
 			this.ws.on('open', () => {
@@ -504,11 +297,7 @@ class BoschDicentisInstance extends InstanceBase {
 				this.isLoggedIn = false
 				
 				// Clear polling timer
-				if (this.pollTimer) {
-					clearInterval(this.pollTimer.discussionList)
-					clearInterval(this.pollTimer.interpretationRoutings)
-					this.pollTimer = null
-				}
+				this.stopPolling()
 				
 				// Schedule reconnect if not already scheduled
 				if (!this.reconnectTimer) {
@@ -531,11 +320,7 @@ class BoschDicentisInstance extends InstanceBase {
 
 	getPermissions() {
 		if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-			const message = {
-				operation: 'GetPermissions',
-				parameters: {}
-			}
-			this.ws.send(JSON.stringify(message))
+			this.ws.send(GET_PERMISSIONS_REQUEST)
 		} else {
 			this.log('error', '[PERMISSIONS] WebSocket not connected')
 		}
@@ -543,11 +328,7 @@ class BoschDicentisInstance extends InstanceBase {
 
 	getSeats() {
 		if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-			const message = {
-				operation: 'getseats',
-				parameters: {}
-			}
-			this.ws.send(JSON.stringify(message))
+			this.ws.send(GET_SEATS_REQUEST)
 		} else {
 			this.log('error', '[SEATS] WebSocket not connected')
 		}
@@ -555,27 +336,36 @@ class BoschDicentisInstance extends InstanceBase {
 
 	getInterpreterBooths() {
 		if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-			const message = {
-				operation: 'GetInterpreterBooths',
-				parameters: {}
-			}
-			this.ws.send(JSON.stringify(message))
+			this.ws.send(GET_INTERPRETER_BOOTHS_REQUEST)
 		} else {
 			this.log('error', '[INTERPRETER] WebSocket not connected')
 		}
 	}
 
 	messageReceivedFromWebSocket(data) {
+		// Polled responses rarely change between ticks, so skip parsing an exact repeat
+		if (data === this.lastDiscussionListData) {
+			this.pendingPolls.delete('GetDiscussionList')
+			return
+		}
+		if (data === this.lastInterpretationRoutingsData) {
+			this.pendingPolls.delete('GetInterpretationRoutings')
+			return
+		}
+
 		try {
 			const msgValue = JSON.parse(data)
 			
-			// Only log non-polling messages
-			if (!['GetDiscussionList', 'GetInterpretationRoutings'].includes(msgValue.operation)) {
-				this.log('debug', `[WEBSOCKET] Message received: ${JSON.stringify(msgValue)}`)
+			// Only log non-polling messages, using the raw payload rather than re-serializing it.
+			// Permissions are skipped here since they are logged at info below
+			if (!POLLED_OPERATIONS.has(msgValue.operation) && msgValue.operation !== 'GetPermissions') {
+				this.log('debug', `[WEBSOCKET] Message received: ${data}`)
 			}
 
 			switch (msgValue.operation) {
 				case 'GetDiscussionList':
+					this.pendingPolls.delete('GetDiscussionList')
+					this.lastDiscussionListData = data
 					this.processDiscussionList(msgValue)
 					break
 				case 'getseats':
@@ -585,7 +375,7 @@ class BoschDicentisInstance extends InstanceBase {
 					this.handleLoginResponse(msgValue)
 					break
 				case 'GetPermissions':
-					this.log('info', `[PERMISSIONS] Server Response: ${JSON.stringify(msgValue)}`)
+					this.log('info', `[PERMISSIONS] Server Response: ${data}`)
 					break
 				case 'GetInterpreterBooths':
 					this.processInterpreterBooths(msgValue)
@@ -594,13 +384,17 @@ class BoschDicentisInstance extends InstanceBase {
 					this.processInterpreterSeats(msgValue)
 					break
 				case 'GetInterpretationRoutings':
+					this.pendingPolls.delete('GetInterpretationRoutings')
+					this.lastInterpretationRoutingsData = data
 					this.processInterpretationRoutings(msgValue)
 					break
 				case 'error':
+					// Error replies don't name the failed request, so release all polls
+					this.pendingPolls.clear()
 					this.log('error', `[WEBSOCKET] Error from server: ${msgValue.parameters?.message || 'Unknown error'}`)
 					break
 				default:
-					this.log('info', `[CUSTOM] Server Response: ${JSON.stringify(msgValue)}`)
+					this.log('info', `[CUSTOM] Server Response: ${data}`)
 			}
 		} catch (error) {
 			this.log('error', `[WEBSOCKET] Error processing message: ${error.message}`)
@@ -612,10 +406,13 @@ class BoschDicentisInstance extends InstanceBase {
 			this.isLoggedIn = true
 			this.updateStatus(InstanceStatus.Ok)
 
-			// Request initial data
+			// Request initial data, pipelining booths and interpreter seats
+			this.interpreterBoothsLoaded = false
+			this.pendingInterpreterSeats = null
 			this.getPermissions()
 			this.getSeats()
 			this.getInterpreterBooths()
+			this.getInterpreterSeats()
 
 			// Start polling after login
 			this.startPolling()
@@ -625,19 +422,6 @@ class BoschDicentisInstance extends InstanceBase {
 		}
 	}
 
-	requestInterpretationRoutings() {
-		if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
-			this.log('error', '[INTERPRETER] WebSocket not connected')
-			return
-		}
-
-		const message = {
-			operation: 'GetInterpretationRoutings',
-			parameters: {}
-		}
-		this.ws.send(JSON.stringify(message))
-	}
-
 	processInterpreterBooths(response) {
 		if (!response.parameters?.booths) {
 			return
@@ -645,6 +429,7 @@ class BoschDicentisInstance extends InstanceBase {
 
 		const booths = response.parameters.booths
 		this.interpreterBooths.clear()
+		this.interpreterBoothsLoaded = true
 
 		booths.forEach(booth => {
 			if (booth.boothId && booth.boothNumber !== undefined) {
@@ -652,8 +437,12 @@ class BoschDicentisInstance extends InstanceBase {
 			}
 		})
 
-		// Now that we have booth numbers, request seats
-		this.getInterpreterSeats()
+		// Interpreter seats are requested in parallel and may already be waiting on booth numbers
+		if (this.pendingInterpreterSeats) {
+			const pending = this.pendingInterpreterSeats
+			this.pendingInterpreterSeats = null
+			this.processInterpreterSeats(pending)
+		}
 	}
 
 	getInterpreterSeats() {
@@ -662,11 +451,7 @@ class BoschDicentisInstance extends InstanceBase {
 			return
 		}
 
-		const message = {
-			operation: 'GetInterpreterSeats',
-			parameters: {}
-		}
-		this.ws.send(JSON.stringify(message))
+		this.ws.send(GET_INTERPRETER_SEATS_REQUEST)
 	}
 
 	processInterpreterSeats(response) {
@@ -674,8 +459,15 @@ class BoschDicentisInstance extends InstanceBase {
 			return
 		}
 
+		// Hold the seats until the booth numbers they reference have arrived
+		if (!this.interpreterBoothsLoaded) {
+			this.pendingInterpreterSeats = response
+			return
+		}
+
 		const seats = response.parameters.seats
 		this.interpreterSeats = {}
+		this.interpreterSeatChoices = null
 
 		seats.forEach(seat => {
 			if (!seat.seatId || !seat.deskNumber || !seat.boothId) {
@@ -699,18 +491,15 @@ class BoschDicentisInstance extends InstanceBase {
 			}
 		})
 
-		this.updateVariables()
-		this.updateActions()
-		this.updateFeedbacks()
-		this.updatePresets()
+		this.scheduleDefinitionsUpdate()
 	}
 
 	processInterpretationRoutings(response) {
-		if (!response.parameters?.routings) {
+		const routings = response.parameters?.routings
+		if (!routings) {
 			return
 		}
 
-		const routings = response.parameters.routings
 		const newStates = new Map()
 
 		routings.forEach(routing => {
@@ -736,19 +525,17 @@ class BoschDicentisInstance extends InstanceBase {
 	}
 
 	grantInterpretation(seatId, state) {
+		if (!seatId || !state) {
+			return
+		}
+
 		if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
 			this.log('error', '[INTERPRETER] WebSocket not connected')
 			return
 		}
 
-		const message = {
-			operation: 'GrantInterpretation',
-			parameters: {
-				seatId: seatId,
-				microphoneState: state
-			}
-		}
-		this.ws.send(JSON.stringify(message))
+		// Same fixed-text approach as sendSpeechRequest
+		this.ws.send(`{"operation":"GrantInterpretation","parameters":{"seatId":${JSON.stringify(seatId)},"microphoneState":${JSON.stringify(state)}}}`)
 	}
 
 	login() {
@@ -767,18 +554,6 @@ class BoschDicentisInstance extends InstanceBase {
 		}
 	}
 
-	requestDiscussionList() {
-		if (!this.isLoggedIn) {
-			return
-		}
-
-		const payload = {
-			operation: 'GetDiscussionList',
-			parameters: {}
-		}
-		this.ws.send(JSON.stringify(payload))
-	}
-
 	updateActions() {
 		const choices = this.getSeatChoices()
 		const interpreterChoices = this.getInterpreterSeatChoices()
@@ -1046,35 +821,43 @@ class BoschDicentisInstance extends InstanceBase {
 			return
 		}
 
-		const seats = response.parameters.seats
-		
+		// Drop incomplete seats up front so sorting and indexing only see valid records
+		const seats = response.parameters.seats.filter(seat => seat.seatId && seat.seatName && seat.screenLine)
+
+		// Extract each seat number once instead of on every comparison
+		const seatNumbers = new Map()
+		seats.forEach(seat => {
+			const match = SEAT_NUMBER_REGEX.exec(seat.seatName)
+			seatNumbers.set(seat, match ? parseInt(match[0]) : null)
+		})
+
 		// Sort seats by their numbers
 		seats.sort((a, b) => {
-			const aMatch = a.seatName.match(/\d+/)
-			const bMatch = b.seatName.match(/\d+/)
+			const aNum = seatNumbers.get(a)
+			const bNum = seatNumbers.get(b)
 			
 			// If both have numbers, compare numerically
-			if (aMatch && bMatch) {
-				const aNum = parseInt(aMatch[0])
-				const bNum = parseInt(bMatch[0])
+			if (aNum !== null && bNum !== null) {
 				return aNum - bNum
 			}
 			
 			// If only one has a number, put numbered ones first
-			if (aMatch) return -1
-			if (bMatch) return 1
+			if (aNum !== null) return -1
+			if (bNum !== null) return 1
 			
 			// Otherwise sort alphabetically
 			return a.seatName.localeCompare(b.seatName)
 		})
 
 		this.seats = {}
+		this.seatsById.clear()
+		this.seatChoices = null
 
-		seats.forEach(seat => {
-			if (!seat.seatId || !seat.seatName || !seat.screenLine) {
-				return
-			}
+		// Reprocess the next discussion list so the active speaker's seat name variable
+		// picks up the new seat list; feedbacks are rechecked by scheduleDefinitionsUpdate
+		this.lastDiscussionListData = null
 
+		seats.forEach(seat => {
 			// Sanitize both seatName and screenLine
 			const sanitizedSeatName = this.sanitizeVariableName(seat.seatName)
 			const sanitizedScreenLine = this.sanitizeVariableName(seat.screenLine)
@@ -1085,28 +868,10 @@ class BoschDicentisInstance extends InstanceBase {
 				name: seat.seatName,
 				screenLine: seat.screenLine
 			}
+			this.seatsById.set(seat.seatId, this.seats[varName])
 		})
 
-		this.updateVariables()
-		this.updateActions()
-		this.updateFeedbacks()
-		this.updatePresets()
-	}
-
-	grantSpeech(seatId) {
-		if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
-			this.log('error', '[SPEECH] WebSocket not connected')
-			return
-		}
-
-		const message = {
-			operation: 'grantSpeech',
-			parameters: {
-				seatIds: [seatId],
-				participantIds: []
-			}
-		}
-		this.ws.send(JSON.stringify(message))
+		this.scheduleDefinitionsUpdate()
 	}
 
 	toggleMicrophone(varName) {
@@ -1124,25 +889,16 @@ class BoschDicentisInstance extends InstanceBase {
 	}
 
 	activateMicrophone(seatId) {
-		if (!seatId) {
-			return
-		}
-
-		if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
-			this.log('error', '[MIC] WebSocket not connected')
-			return
-		}
-
-		const message = {
-			operation: 'grantspeech',
-			parameters: {
-				seatIds: [seatId]
-			}
-		}
-		this.ws.send(JSON.stringify(message))
+		this.sendSpeechRequest('grantspeech', seatId)
 	}
 
 	deactivateMicrophone(seatId) {
+		this.sendSpeechRequest('removespeech', seatId)
+	}
+
+	// Per-press requests are written as fixed JSON text with only the varying
+	// values encoded, instead of building and serializing a whole object
+	sendSpeechRequest(operation, seatId) {
 		if (!seatId) {
 			return
 		}
@@ -1152,47 +908,54 @@ class BoschDicentisInstance extends InstanceBase {
 			return
 		}
 
-		const message = {
-			operation: 'removespeech',
-			parameters: {
-				seatIds: [seatId]
-			}
-		}
-		this.ws.send(JSON.stringify(message))
+		this.ws.send(`{"operation":"${operation}","parameters":{"seatIds":[${JSON.stringify(seatId)}]}}`)
 	}
 
 	processDiscussionList(response) {
-		if (!response.parameters?.discussionList) {
+		const discussionList = response.parameters?.discussionList
+		if (!discussionList) {
 			return
 		}
 
-		const discussionList = response.parameters.discussionList
-		this.activeMics.clear()
-
-		// Process each participant in the discussion list
-		discussionList.forEach(participant => {
+		// Index active mics and remember the first active speaker in one pass
+		const activeMics = new Set()
+		let activeParticipant = null
+		for (const participant of discussionList) {
 			if (participant.microphoneState === 'on') {
-				this.activeMics.add(participant.seatId)
+				activeMics.add(participant.seatId)
+				if (!activeParticipant) {
+					activeParticipant = participant
+				}
 			}
-		})
+		}
 
 		// Update the variables with the screenLine and seatName of the active speaker
-		const variables = {}
-		const activeParticipant = discussionList.find(p => p.microphoneState === 'on')
-		
+		let screenLine = ''
+		let seatName = ''
+
 		if (activeParticipant) {
-			// Find the seat info from our stored seats using the seatId
-			const activeSeat = Object.values(this.seats).find(seat => seat.seatId === activeParticipant.seatId)
+			// Look up the seat info from our stored seats using the seatId
+			const activeSeat = this.seatsById.get(activeParticipant.seatId)
 			
-			variables['Active_Microphone_ScreenLine'] = activeParticipant.screenLine || ''
-			variables['Active_Microphone_SeatName'] = activeSeat ? activeSeat.name : ''
-		} else {
-			variables['Active_Microphone_ScreenLine'] = ''
-			variables['Active_Microphone_SeatName'] = ''
+			screenLine = activeParticipant.screenLine || ''
+			seatName = activeSeat ? activeSeat.name : ''
 		}
 
-		this.setVariableValues(variables)
-		this.checkFeedbacks('mic_state')
+		// Only push the variables when the active speaker actually changed
+		if (screenLine !== this.activeScreenLine || seatName !== this.activeSeatName) {
+			this.activeScreenLine = screenLine
+			this.activeSeatName = seatName
+			this.setVariableValues({
+				Active_Microphone_ScreenLine: screenLine,
+				Active_Microphone_SeatName: seatName
+			})
+		}
+
+		// Only re-evaluate mic feedbacks when the set of active mics changed
+		if (!this.areSetsEqual(this.activeMics, activeMics)) {
+			this.activeMics = activeMics
+			this.checkFeedbacks('mic_state')
+		}
 	}
 
 	// Helper function to compare Sets
@@ -1257,15 +1020,7 @@ class BoschDicentisInstance extends InstanceBase {
 		this.config = config
 
 		// Validate config
-		if (!config.server_ip) {
-			this.log('error', '[CONFIG] Server IP is required')
-			this.updateStatus(InstanceStatus.BadConfig, 'Server IP is required')
-			return
-		}
-		
-		if (!config.username) {
-			this.log('error', '[CONFIG] Username is required')
-			this.updateStatus(InstanceStatus.BadConfig, 'Username is required')
+		if (!this.validateConfig(config)) {
 			return
 		}
 
@@ -1282,6 +1037,9 @@ class BoschDicentisInstance extends InstanceBase {
 
 			// Reinitialize connection
 			this.initWebSocket()
+		} else if (this.isLoggedIn) {
+			// Apply a changed poll interval without reconnecting
+			this.startPolling()
 		}
 
 		this.updateStatus(InstanceStatus.Ok)